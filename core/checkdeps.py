@@ -44,3 +44,14 @@ except Exception as e:
 else:
 	HAS_IMGIO = True
 	log.debug('ImageIO Freeimage plugin available')
+
+
+#urllib3 (bundled with Blender Python), used for keep-alive http connections
+try:
+	import urllib3
+except:
+	HAS_URLLIB3 = False
+	log.debug('urllib3 unavailable')
+else:
+	HAS_URLLIB3 = True
+	log.debug('urllib3 available')
@@ -2,4 +2,4 @@ from .georef import GeoRef
 from .georaster import GeoRaster
 from .npimg import NpImage
 from .bigtiffwriter import BigTiffWriter
-from .img_utils import getImgFormat, getImgDim, isValidStream
+from .img_utils import getImgFormat, getImgDim, getImgInfo, isValidStream
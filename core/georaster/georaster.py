@@ -28,7 +28,7 @@ from ..lib import Tyf #geotags reader
 
 from .georef import GeoRef
 from .npimg import NpImage
-from .img_utils import getImgFormat, getImgDim
+from .img_utils import getImgInfo
 
 from ..utils import XY as xy
 from ..errors import OverlapError
@@ -61,7 +61,8 @@ class GeoRaster():
 
 		if not useGDAL or not HAS_GDAL:
 
-			self.format = getImgFormat(path)
+			#read format and size with a single file access
+			self.format, w, h = getImgInfo(path)
 			if self.format not in ['TIFF', 'BMP', 'PNG', 'JPEG', 'JPEG2000']:
 				raise IOError("Unsupported format {}".format(self.format))
 
@@ -72,8 +73,7 @@ class GeoRaster():
 				else:
 					pass
 			else:
-				# Try to read file header
-				w, h = getImgDim(self.path)
+				# Size from file header
 				if w is None or h is None:
 					raise IOError("Unable to read raster size")
 				else:
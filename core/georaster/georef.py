@@ -21,6 +21,8 @@
 
 import math
 
+import numpy as np
+
 from ..proj import SRS
 from ..utils import XY as xy, BBOX
 from ..errors import OverlapError
@@ -50,6 +52,9 @@ class GeoRef():
 			self.origin[0] += abs(self.pxSize.x/2)
 			self.origin[1] -= abs(self.pxSize.y/2)
 		self.rotation = xy(*rot)
+		#cached corners and bbox values, keyed on the georef values they are computed from
+		self._geom = None
+		self._geomKey = None
 		if subBoxGeo is not None:
 			# Define a subbox at init is optionnal, we can also do it later
 			# Setting the subBox will check if the box overlap the raster extent
@@ -239,26 +244,39 @@ class GeoRef():
 		(pt1, pt2, pt3, pt4) <--> (upper left, upper right, bottom right, bottom left)
 		Represent the true corner location (upper left for pt1, upper right for pt2 ...)
 		'''
-		#get corners at center
-		pt1, pt2, pt3, pt4 = self.cornersCenter
-		#pixel center offset
-		xOffset = abs(self.pxSize.x/2)
-		yOffset = abs(self.pxSize.y/2)
-		pt1 = xy(pt1.x - xOffset, pt1.y + yOffset)
-		pt2 = xy(pt2.x + xOffset, pt2.y + yOffset)
-		pt3 = xy(pt3.x + xOffset, pt3.y - yOffset)
-		pt4 = xy(pt4.x - xOffset, pt4.y - yOffset)
-		return (pt1, pt2, pt3, pt4)
+		#return new objects so that the caller can't alter the cached values
+		corners, _ = self._getGeom()
+		return tuple(xy(*pt) for pt in corners)
 
 	@property
 	def bbox(self):
 		'''Return a bbox class object'''
-		pts = self.corners
-		xmin = min([pt.x for pt in pts])
-		xmax = max([pt.x for pt in pts])
-		ymin = min([pt.y for pt in pts])
-		ymax = max([pt.y for pt in pts])
-		return BBOX(xmin=xmin, ymin=ymin, xmax=xmax, ymax=ymax)
+		_, bbox = self._getGeom()
+		return BBOX(*bbox)
+
+	def _getGeom(self):
+		'''
+		Return the cached corners and bbox as immutable tuples ((x,y)*4, (xmin, ymin, xmax, ymax))
+		The key is a snapshot of the georef values, so the cache is also refreshed
+		if these values are reassigned or modified in place
+		'''
+		key = (tuple(self.rSize), tuple(self.origin), tuple(self.pxSize), tuple(self.rotation))
+		if self._geomKey != key:
+			#get corners at center
+			pt1, pt2, pt3, pt4 = self.cornersCenter
+			#pixel center offset
+			xOffset = abs(self.pxSize.x/2)
+			yOffset = abs(self.pxSize.y/2)
+			corners = (
+				(pt1.x - xOffset, pt1.y + yOffset),
+				(pt2.x + xOffset, pt2.y + yOffset),
+				(pt3.x + xOffset, pt3.y - yOffset),
+				(pt4.x - xOffset, pt4.y - yOffset)
+			)
+			xs, ys = zip(*corners)
+			self._geom = (corners, (min(xs), min(ys), max(xs), max(ys)))
+			self._geomKey = key
+		return self._geom
 
 	@property
 	def bboxPx(self):
@@ -330,6 +348,11 @@ class GeoRef():
 		rotx, roty = self.rotation
 		offx = self.origin.x - abs(self.pxSize.x/2)
 		offy = self.origin.y + abs(self.pxSize.y/2)
+		# shortcut for integer pixel size without rotation, the affine transfo reduces to a floor division
+		# (checked against the current values, so it stays valid if pxSize or rotation are modified)
+		if round2Floor and not reverseY and rotx == 0 and roty == 0 \
+		and float(pxSizex).is_integer() and float(pxSizey).is_integer():
+			return xy(int((x - offx) // pxSizex), int((y - offy) // pxSizey))
 		# transfo
 		xPx  = (pxSizey*x - rotx*y + rotx*offy - pxSizey*offx) / (pxSizex*pxSizey - rotx*roty)
 		yPx = (-roty*x + pxSizex*y + roty*offx - pxSizex*offy) / (pxSizex*pxSizey - rotx*roty)
@@ -348,6 +371,47 @@ class GeoRef():
 	def geoToPx(self, x, y, reverseY=False, round2Floor=False):
 		return self.pxFromGeo(x, y, reverseY, round2Floor)
 
+	#Vectorized versions, same transformations applied on numpy arrays of coordinates
+
+	def pxToGeoArr(self, xPx, yPx, reverseY=False, pxCenter=True):
+		"""
+		Array version of geoFromPx()
+		xPx, yPx : arrays of pixels columns and rows
+		return a tuple of arrays (x, y)
+		"""
+		xPx, yPx = np.asarray(xPx), np.asarray(yPx)
+		if pxCenter:
+			xPx, yPx = np.floor(xPx), np.floor(yPx)
+			ox, oy = self.origin.x, self.origin.y
+		else:
+			ox = self.origin.x - abs(self.pxSize.x/2)
+			oy = self.origin.y + abs(self.pxSize.y/2)
+		if reverseY:
+			yPx = (self.rSize.y - 1) - yPx
+		x = self.pxSize.x * xPx + self.rotation.y * yPx + ox
+		y = self.pxSize.y * yPx + self.rotation.x * xPx + oy
+		return x, y
+
+	def geoToPxArr(self, x, y, reverseY=False, round2Floor=False):
+		"""
+		Array version of pxFromGeo()
+		x, y : arrays of geographic coordinates
+		return a tuple of arrays (xPx, yPx), as integers if round2Floor
+		"""
+		x, y = np.asarray(x), np.asarray(y)
+		pxSizex, pxSizey = self.pxSize
+		rotx, roty = self.rotation
+		offx = self.origin.x - abs(self.pxSize.x/2)
+		offy = self.origin.y + abs(self.pxSize.y/2)
+		det = pxSizex*pxSizey - rotx*roty
+		xPx = (pxSizey*x - rotx*y + rotx*offy - pxSizey*offx) / det
+		yPx = (-roty*x + pxSizex*y + roty*offx - pxSizex*offy) / det
+		if reverseY:
+			yPx = (self.rSize.y - 1) - yPx + 1
+		if round2Floor:
+			xPx, yPx = np.floor(xPx).astype(int), np.floor(yPx).astype(int)
+		return xPx, yPx
+
 	############################################
 	# Subbox handlers
 	############################################
@@ -33,96 +33,128 @@ def isValidStream(data):
 	return True
 
 
+############################################
+# Header parsers, all take the opened file and its first 32 bytes
+# and return (width, height)
+
+def _gifDim(fhandle, head):
+	try:
+		return struct.unpack("<hh", head[6:10])
+	except struct.error:
+		raise ValueError("Invalid GIF file")
+
+def _pngDim(fhandle, head):
+	try:
+		return struct.unpack(">LL", head[16:24])
+	except struct.error:
+		# Maybe this is for an older PNG version.
+		try:
+			return struct.unpack(">LL", head[8:16])
+		except struct.error:
+			raise ValueError("Invalid PNG file")
+
+def _jpegDim(fhandle, head, chunkSize=65536):
+	"""
+	Walk the JPEG segments until a SOFn block
+	The header is parsed from an in-memory buffer extended by chunks only if needed,
+	instead of reading the file byte per byte
+	"""
+	fhandle.seek(0)
+	buf = fhandle.read(chunkSize)
+
+	def ensure(n):
+		#make sure the buffer contains at least n bytes
+		nonlocal buf
+		while len(buf) < n:
+			chunk = fhandle.read(max(chunkSize, n - len(buf)))
+			if not chunk:
+				raise ValueError("Invalid JPEG file")
+			buf += chunk
+
+	try:
+		pos = 0
+		size = 2 # Read 0xff next
+		ftype = 0
+		while not 0xc0 <= ftype <= 0xcf:
+			pos += size
+			ensure(pos + 1)
+			while buf[pos] == 0xff:
+				pos += 1
+				ensure(pos + 1)
+			ftype = buf[pos]
+			ensure(pos + 3)
+			size = struct.unpack_from('>H', buf, pos + 1)[0] - 2
+			pos += 3
+		# We are at a SOFn block, skip `precision' byte.
+		ensure(pos + 5)
+		height, width = struct.unpack_from('>HH', buf, pos + 1)
+	except struct.error:
+		raise ValueError("Invalid JPEG file")
+	return width, height
+
+def _jp2Dim(fhandle, head):
+	fhandle.seek(48)
+	try:
+		height, width = struct.unpack('>LL', fhandle.read(8))
+	except struct.error:
+		raise ValueError("Invalid JPEG2000 file")
+	return width, height
+
+def _bmpDim(fhandle, head):
+	try:
+		return struct.unpack("<LL", head[18:26])
+	except struct.error:
+		raise ValueError("Invalid BMP file")
+
+
+# Magic numbers dispatch table : (format, header test, dimensions parser)
+# order matters, the first matching test wins
+_IMG_FORMATS = [
+	('GIF', lambda head: head[:6] in (b'GIF87a', b'GIF89a'), _gifDim),
+	('PNG', lambda head: head.startswith(b'\211PNG\r\n\032\n'), _pngDim),
+	('JPEG', lambda head: b'JFIF' in head or b'Exif' in head or b'8BIM' in head or head.startswith(b'\xff\xd8'), _jpegDim),
+	('JPEG2000', lambda head: head.startswith(b'\x00\x00\x00\x0cjP  \r\n\x87\n'), _jp2Dim),
+	('BMP', lambda head: head.startswith(b'BM'), _bmpDim),
+	('TIFF', lambda head: head[:2] in (b'MM', b'II'), None),
+	('EXR', lambda head: head.startswith(b'\x76\x2f\x31\x01'), None)
+]
+
+def _matchFormat(head):
+	for format, test, getDim in _IMG_FORMATS:
+		if test(head):
+			return format, getDim
+	return None, None
+
+
 def getImgFormat(filepath):
 	"""
 	Read header of an image file and try to determine it's format
 	no requirements, support JPEG, JPEG2000, PNG, GIF, BMP, TIFF, EXR
 	"""
-	format = None
 	with open(filepath, 'rb') as fhandle:
 		head = fhandle.read(32)
-		# handle GIFs
-		if head[:6] in (b'GIF87a', b'GIF89a'):
-			format = 'GIF'
-		# handle PNG
-		elif head.startswith(b'\211PNG\r\n\032\n'):
-			format = 'PNG'
-		# handle JPEGs
-		#elif head[6:10] in (b'JFIF', b'Exif')
-		elif (b'JFIF' in head or b'Exif' in head or b'8BIM' in head) or head.startswith(b'\xff\xd8'):
-			format = 'JPEG'
-		# handle JPEG2000s
-		elif head.startswith(b'\x00\x00\x00\x0cjP  \r\n\x87\n'):
-			format = 'JPEG2000'
-		# handle BMP
-		elif head.startswith(b'BM'):
-			format = 'BMP'
-		# handle TIFF
-		elif head[:2] in (b'MM', b'II'):
-			format = 'TIFF'
-		# handle EXR
-		elif head.startswith(b'\x76\x2f\x31\x01'):
-			format = 'EXR'
+	format, getDim = _matchFormat(head)
 	return format
 
 
-
 def getImgDim(filepath):
 	"""
 	Return (width, height) for a given img file content
 	no requirements, support JPEG, JPEG2000, PNG, GIF, BMP
 	"""
-	width, height = None, None
+	format, width, height = getImgInfo(filepath)
+	return width, height
 
+
+def getImgInfo(filepath):
+	"""
+	Return (format, width, height) for a given img file, the file is opened only once
+	width and height are None if the format is unknown or if its header parser is not implemented (TIFF, EXR)
+	"""
 	with open(filepath, 'rb') as fhandle:
 		head = fhandle.read(32)
-		# handle GIFs
-		if head[:6] in (b'GIF87a', b'GIF89a'):
-			try:
-				width, height = struct.unpack("<hh", head[6:10])
-			except struct.error:
-				raise ValueError("Invalid GIF file")
-		# handle PNG
-		elif head.startswith(b'\211PNG\r\n\032\n'):
-			try:
-				width, height = struct.unpack(">LL", head[16:24])
-			except struct.error:
-				# Maybe this is for an older PNG version.
-				try:
-					width, height = struct.unpack(">LL", head[8:16])
-				except struct.error:
-					raise ValueError("Invalid PNG file")
-		# handle JPEGs
-		elif (b'JFIF' in head or b'Exif' in head or b'8BIM' in head) or head.startswith(b'\xff\xd8'):
-			try:
-				fhandle.seek(0) # Read 0xff next
-				size = 2
-				ftype = 0
-				while not 0xc0 <= ftype <= 0xcf:
-					fhandle.seek(size, 1)
-					byte = fhandle.read(1)
-					while ord(byte) == 0xff:
-						byte = fhandle.read(1)
-					ftype = ord(byte)
-					size = struct.unpack('>H', fhandle.read(2))[0] - 2
-				# We are at a SOFn block
-				fhandle.seek(1, 1)  # Skip `precision' byte.
-				height, width = struct.unpack('>HH', fhandle.read(4))
-			except struct.error:
-				raise ValueError("Invalid JPEG file")
-		# handle JPEG2000s
-		elif head.startswith(b'\x00\x00\x00\x0cjP  \r\n\x87\n'):
-			fhandle.seek(48)
-			try:
-				height, width = struct.unpack('>LL', fhandle.read(8))
-			except struct.error:
-				raise ValueError("Invalid JPEG2000 file")
-		# handle BMP
-		elif head.startswith(b'BM'):
-			imgtype = 'BMP'
-			try:
-				width, height = struct.unpack("<LL", head[18:26])
-			except struct.error:
-				raise ValueError("Invalid BMP file")
-
-	return width, height
+		format, getDim = _matchFormat(head)
+		if getDim is None:
+			return format, None, None
+		width, height = getDim(fhandle, head)
+	return format, width, height
@@ -41,6 +41,9 @@ if HAS_GDAL:
 if HAS_IMGIO:
 	from ..lib import imageio
 
+#Deflate level used when encoding png blobs, low level is much faster to encode at the cost of a slightly bigger output
+PNG_COMPRESS_LEVEL = 1
+
 
 class NpImage():
 	'''Represent an image as Numpy array'''
@@ -198,12 +201,15 @@ class NpImage():
 
 	@classmethod
 	def new(cls, w, h, bkgColor=(255,255,255,255), noData=None, georef=None):
-		r, g, b, a = bkgColor
-		data = np.empty((h, w, 4), np.uint8)
-		data[:,:,0] = r
-		data[:,:,1] = g
-		data[:,:,2] = b
-		data[:,:,3] = a
+		if len(bkgColor) != 4:
+			raise ValueError('Background color must be a RGBA tuple, got {}'.format(bkgColor))
+		if len(set(bkgColor)) == 1:
+			#same value for all bands, fill the buffer at once
+			data = np.full((h, w, 4), bkgColor[0], np.uint8)
+		else:
+			#single broadcasted write of the rgba pixel value
+			data = np.empty((h, w, 4), np.uint8)
+			data[...] = np.array(bkgColor, np.uint8)
 		return cls(data, noData=noData, georef=georef)
 
 	def _applySubBox(self, data):
@@ -231,28 +237,31 @@ class NpImage():
 
 	def _npFromBLOB(self, data):
 		'''Get Numpy array from Bytes data'''
-
-		if self.IFACE == 'PIL':
-			#convert bytes object to bytesio (stream buffer) and open it with PIL
-			img = Image.open(io.BytesIO(data))
-			data = self._npFromPIL(img)
-
-		elif self.IFACE == 'IMGIO':
-			img = io.BytesIO(data)
-			data = self._npFromImgIO(img)
-
-		elif self.IFACE == 'GDAL':
-			#Use a virtual memory file to create gdal dataset from buffer
-			#build a random name to make the function thread safe
-			vsipath = '/vsimem/' + ''.join(random.choice('abcdefghijklmnopqrstuvwxyz') for i in range(5))
-			gdal.FileFromMemBuffer(vsipath, data)
-			ds = gdal.Open(vsipath)
-			data = self._npFromGDAL(ds)
-			ds = None
-			gdal.Unlink(vsipath)
-
+		return self._BLOB_DECODERS[self.IFACE](self, data)
+
+	def _decodePIL(self, data):
+		#convert bytes object to bytesio (stream buffer) and open it with PIL
+		img = Image.open(io.BytesIO(data))
+		return self._npFromPIL(img)
+
+	def _decodeIMGIO(self, data):
+		img = io.BytesIO(data)
+		return self._npFromImgIO(img)
+
+	def _decodeGDAL(self, data):
+		#Use a virtual memory file to create gdal dataset from buffer
+		#build a random name to make the function thread safe
+		vsipath = '/vsimem/' + ''.join(random.choice('abcdefghijklmnopqrstuvwxyz') for i in range(5))
+		gdal.FileFromMemBuffer(vsipath, data)
+		ds = gdal.Open(vsipath)
+		data = self._npFromGDAL(ds)
+		ds = None
+		gdal.Unlink(vsipath)
 		return data
 
+	#BLOB decoder for each image engine
+	_BLOB_DECODERS = {'PIL': _decodePIL, 'IMGIO': _decodeIMGIO, 'GDAL': _decodeGDAL}
+
 	def _npFromImgIO(self, img):
 		'''Use ImageIO to extract numpy array from image path or bytesIO'''
 		data = imageio.imread(img)
@@ -281,12 +290,10 @@ class NpImage():
 			ctable = ds.GetRasterBand(1).GetColorTable()
 			if ctable is not None:
 				#Swap index values to their corresponding color (rgba)
+				#palette entries are indexed from 0 to nbColors-1 so the index values can be used directly as lookup table keys
 				nbColors = ctable.GetCount()
-				keys = np.array( [i for i in range(nbColors)] )
-				values = np.array( [ctable.GetColorEntry(i) for i in range(nbColors)] )
-				sortIdx = np.argsort(keys)
-				idx = np.searchsorted(keys, data, sorter=sortIdx)
-				data = values[sortIdx][idx]
+				values = np.array( [ctable.GetColorEntry(i) for i in range(nbColors)], dtype=np.uint8 )
+				data = values[data]
 
 		#Try to extract georef
 		if not self.isGeoref:
@@ -303,37 +310,51 @@ class NpImage():
 		'''Get bytes raw data'''
 		if ext == 'JPG':
 			ext = 'JPEG'
+		return self._BLOB_ENCODERS[self.IFACE](self, ext)
 
-		if self.IFACE == 'PIL':
-			b = io.BytesIO()
-			img = Image.fromarray(self.data)
+	def _encodePIL(self, ext):
+		b = io.BytesIO()
+		img = Image.fromarray(self.data)
+		if ext == 'PNG':
+			img.save(b, format=ext, compress_level=PNG_COMPRESS_LEVEL)
+		else:
 			img.save(b, format=ext)
-			data = b.getvalue() #convert bytesio to bytes
-
-		elif self.IFACE == 'IMGIO':
-			if ext == 'JPEG' and self.hasAlpha:
-				self.removeAlpha()
-			data = imageio.imwrite(imageio.RETURN_BYTES, self.data, format=ext)
+		return b.getvalue() #convert bytesio to bytes
 
-		elif self.IFACE == 'GDAL':
-			mem = self.toGDAL()
-			#build a random name to make the function thread safe
-			name = ''.join(random.choice('abcdefghijklmnopqrstuvwxyz') for i in range(5))
-			vsiname = '/vsimem/' + name + '.png'
-			out = gdal.GetDriverByName(ext).CreateCopy(vsiname, mem)
-			# Read /vsimem/output.png
+	def _encodeIMGIO(self, ext):
+		if ext == 'JPEG' and self.hasAlpha:
+			self.removeAlpha()
+		if ext == 'PNG':
+			return imageio.imwrite(imageio.RETURN_BYTES, self.data, format=ext, compression=PNG_COMPRESS_LEVEL)
+		else:
+			return imageio.imwrite(imageio.RETURN_BYTES, self.data, format=ext)
+
+	def _encodeGDAL(self, ext):
+		mem = self.toGDAL()
+		#build a random name to make the function thread safe
+		name = ''.join(random.choice('abcdefghijklmnopqrstuvwxyz') for i in range(5))
+		vsiname = '/vsimem/' + name + '.png'
+		options = ['ZLEVEL=' + str(PNG_COMPRESS_LEVEL)] if ext == 'PNG' else []
+		out = gdal.GetDriverByName(ext).CreateCopy(vsiname, mem, options=options)
+		out = None #close the dataset to flush it into the virtual file
+		if hasattr(gdal, 'VSIGetMemFileBuffer_unsafe'):
+			#get the virtual file content without opening, seeking and reading it
+			data = bytes(gdal.VSIGetMemFileBuffer_unsafe(vsiname))
+		else:
 			f = gdal.VSIFOpenL(vsiname, 'rb')
 			gdal.VSIFSeekL(f, 0, 2) # seek to end
 			size = gdal.VSIFTellL(f)
 			gdal.VSIFSeekL(f, 0, 0) # seek to beginning
 			data = gdal.VSIFReadL(1, size, f)
 			gdal.VSIFCloseL(f)
-			# Cleanup
-			gdal.Unlink(vsiname)
-			mem = None
-
+		# Cleanup
+		gdal.Unlink(vsiname)
+		mem = None
 		return data
 
+	#BLOB encoder for each image engine
+	_BLOB_ENCODERS = {'PIL': _encodePIL, 'IMGIO': _encodeIMGIO, 'GDAL': _encodeGDAL}
+
 
 
 	def toPIL(self):
@@ -349,10 +370,13 @@ class NpImage():
 		if dtype == 'uint8': dtype = 'byte'
 		dtype = gdal.GetDataTypeByName(dtype)
 		mem = gdal.GetDriverByName('MEM').Create('', w, h, n, dtype)
-		#writearray is available only at band level
 		if self.isOneBand:
 			mem.GetRasterBand(1).WriteArray(self.data)
+		elif hasattr(mem, 'WriteArray'):
+			#write all bands at once, dataset level writearray expects (bands, rows, cols) order
+			mem.WriteArray(np.ascontiguousarray(np.moveaxis(self.data, 2, 0)))
 		else:
+			#older gdal, writearray is available only at band level
 			for bandIdx in range(n):
 				bandArray = self.data[:,:,bandIdx]
 				mem.GetRasterBand(bandIdx+1).WriteArray(bandArray)
@@ -418,17 +442,31 @@ class NpImage():
 		data = img.data
 		w, h = img.size
 
-		if img.isOneBand and self.isOneBand:
-			self.data[y:y+h, x:x+w] = data
-		elif (not img.isOneBand and self.isOneBand) or (img.isOneBand and not self.isOneBand):
+		if img.isOneBand != self.isOneBand:
 			raise ValueError('Paste error, cannot mix one band with multiband')
 
-		if self.hasAlpha:
-			n = img.nbBands
-			self.data[y:y+h, x:x+w, 0:n] = data
+		#clip the pasted data against this image extent
+		width, height = self.size
+		x1, y1 = max(x, 0), max(y, 0)
+		x2, y2 = min(x + w, width), min(y + h, height)
+		if x1 >= x2 or y1 >= y2:
+			return #nothing to paste
+		data = data[y1-y:y2-y, x1-x:x2-x]
+
+		if self.isOneBand:
+			idx = np.s_[y1:y2, x1:x2]
+		elif self.hasAlpha:
+			idx = np.s_[y1:y2, x1:x2, 0:img.nbBands]
+		else:
+			idx = np.s_[y1:y2, x1:x2, :]
+			data = data[:, :, 0:self.nbBands]
+
+		if np.ma.isMaskedArray(self.data):
+			#let masked array update its mask
+			self.data[idx] = data
 		else:
-			n = self.nbBands
-			self.data[y:y+h, x:x+w, :] = data[:, :, 0:n]
+			#direct copy into the destination view (plain memcpy when dtypes and layouts match)
+			np.copyto(self.data[idx], data, casting='unsafe')
 
 	def cast2float(self):
 		if not self.isFloat:
@@ -85,7 +85,7 @@ __docformat__ = 'restructuredtext en'
 __all__ = 'interpolate',
 
 
-def interpolate(x, y, x_new, axis=-1, out=None):
+def interpolate(x, y, x_new, axis=-1, out=None, force_float64=True):
     """Return interpolated data using Akima's method.
 
     This Python implementation is inspired by the Matlab(r) code by
@@ -108,6 +108,10 @@ def interpolate(x, y, x_new, axis=-1, out=None):
     out : array
         Optional array to receive results. Dimension at axis must equal
         length of x.
+    force_float64 : bool
+        If True (default), compute in double precision. Otherwise use the
+        smallest floating point type able to hold the inputs (at least
+        float32), which halves memory traffic for single precision data.
 
     Examples
     --------
@@ -126,9 +130,15 @@ def interpolate(x, y, x_new, axis=-1, out=None):
     True
 
     """
-    x = numpy.array(x, dtype=numpy.float64, copy=True)
-    y = numpy.array(y, dtype=numpy.float64, copy=True)
-    xi = numpy.array(x_new, dtype=numpy.float64, copy=True)
+    if force_float64:
+        dtype = numpy.float64
+    else:
+        dtype = numpy.result_type(numpy.asarray(x), numpy.asarray(y),
+                                  numpy.asarray(x_new), numpy.float32)
+    # inputs are never modified, only convert them when needed
+    x = numpy.asarray(x, dtype=dtype)
+    y = numpy.asarray(y, dtype=dtype)
+    xi = numpy.asarray(x_new, dtype=dtype)
 
     if axis != -1 or out is not None or y.ndim != 1:
         raise NotImplementedError("implemented in C extension module")
@@ -143,13 +153,14 @@ def interpolate(x, y, x_new, axis=-1, out=None):
         raise ValueError("size of x-array must match data shape")
 
     dx = numpy.diff(x)
-    if any(dx <= 0.0):
+    if not (dx > 0.0).all():
         raise ValueError("x-axis not valid")
 
-    if any(xi < x[0]) or any(xi > x[-1]):
+    if xi.size and (xi.min() < x[0] or xi.max() > x[-1]):
         raise ValueError("interpolation x-axis out of bounds")
 
-    m = numpy.diff(y) / dx
+    m = numpy.subtract(y[1:], y[:-1])
+    m /= dx
     mm = 2.0 * m[0] - m[1]
     mmm = 2.0 * mm - m[0]
     mp = 2.0 * m[n - 2] - m[n - 3]
@@ -157,7 +168,8 @@ def interpolate(x, y, x_new, axis=-1, out=None):
 
     m1 = numpy.concatenate(([mmm], [mm], m, [mp], [mpp]))
 
-    dm = numpy.abs(numpy.diff(m1))
+    dm = numpy.subtract(m1[1:], m1[:-1])
+    numpy.abs(dm, out=dm)
     f1 = dm[2:n + 2]
     f2 = dm[0:n]
     f12 = f1 + f2
@@ -166,10 +178,16 @@ def interpolate(x, y, x_new, axis=-1, out=None):
     b = m1[1:n + 1]
 
     b[ids] = (f1[ids] * m1[ids + 1] + f2[ids] * m1[ids + 2]) / f12[ids]
-    c = (3.0 * m - 2.0 * b[0:n - 1] - b[1:n]) / dx
-    d = (b[0:n - 1] + b[1:n] - 2.0 * m) / dx ** 2
-
-    bins = numpy.digitize(xi, x)
+    inv_dx = 1.0 / dx
+    inv_dx2 = inv_dx * inv_dx
+    c = (3.0 * m - 2.0 * b[0:n - 1] - b[1:n]) * inv_dx
+    d = (b[0:n - 1] + b[1:n] - 2.0 * m) * inv_dx2
+
+    # x is already known to be strictly increasing, so search the bins
+    # directly instead of letting digitize check monotonicity again.
+    # searchsorted narrows its range from the previous key when xi is
+    # sorted (dense resampling), which keeps the scan cache friendly.
+    bins = numpy.searchsorted(x, xi, side='right')
     bins = numpy.minimum(bins, n - 1) - 1
     bb = bins[0:len(xi)]
     wj = xi - x[bb]
@@ -1,5 +1,8 @@
 
 
+#Note : these functions are plain arithmetic expressions so they also work
+#element wise on numpy arrays, prefer calling them once with arrays instead of in a loop
+
 #Scale/normalize function : linear stretch from lowest value to highest value
 #########################################
 def scale(inVal, inMin, inMax, outMin, outMax):
@@ -8,9 +11,5 @@ def scale(inVal, inMin, inMax, outMin, outMax):
 
 
 def linearInterpo(x1, x2, y1, y2, x):
-	#Linear interpolation = y1 + slope * tx
-	dx = x2 - x1
-	dy = y2-y1
-	slope = dy/dx
-	tx = x - x1 #position from x1 (target x)
-	return y1 + slope * tx
+	#Linear interpolation = y1 + slope * tx (tx = position from x1)
+	return y1 + (y2 - y1) / (x2 - x1) * (x - x1)
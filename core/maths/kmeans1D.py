@@ -28,10 +28,12 @@ In contrast, this script works in a reasonable time, but keep in mind it's not J
 reference to distribute the values while Jenks try to minimize within-class variance, and maximizes between group variance.
 """
 
+from itertools import accumulate
+
 from ..utils.timing import perf_clock
 
 
-def kmeans1d(data, k, cutoff=False, maxIter=False):
+def kmeans1d(data, k, cutoff=False, maxIter=False, verbose=False):
 	'''
 	Compute natural breaks of a one dimensionnal list through an optimized kmeans algorithm
 	Inputs:
@@ -39,18 +41,15 @@ def kmeans1d(data, k, cutoff=False, maxIter=False):
 	* k = number of expected classes
 	* cutoff (optional) = stop algorithm when centroids shift are under this value
 	* maxIter (optional) = stop algorithm when iteration count reach this value
+	* verbose (optional) = print the number of iterations needed to converge
 	Output:
 	* A list of k clusters. A cluster is represented by a tuple containing first and last index of the cluster's values.
 	Use these index on the input data list to retreive the effectives values containing in a cluster.
 	'''
 
-	def getClusterValues(cluster):
-		i, j = cluster
-		return data[i:j+1]
-
 	def getClusterCentroid(cluster):
-		values = getClusterValues(cluster)
-		return sum(values) / len(values)
+		i, j = cluster
+		return (cumsum[j+1] - cumsum[i]) / (j - i + 1)
 
 	n = len(data)
 	if k >= n:
@@ -58,15 +57,20 @@ def kmeans1d(data, k, cutoff=False, maxIter=False):
 	if k == 1:
 		return [ [0, n-1] ]
 
+	# Prefix sums of the data, so that a cluster mean is computed from its bounds only
+	# without summing all its values at each iteration
+	cumsum = [0]
+	cumsum.extend(accumulate(data))
+
 	# Step 1: Create k clusters with quantile classification
 	#  quantile = number of value per clusters
-	q = int(n // k) #with floor, last cluster will be bigger the others, with ceil it will be smaller
+	q = n // k
 	if q == 1:
 		raise ValueError('Too many expected classes')
+	#  balanced borders : the remaining values are spread over the clusters instead of being added to the last one
+	borders = [i * n // k for i in range(k+1)]
 	#  define a cluster with its first and last index
-	clusters = [ [i, i+q-1] for i in range(0, q*k, q)]
-	#  adjust the last index of the last cluster to the effective number of value
-	clusters[-1][1] = n-1
+	clusters = [ [borders[i], borders[i+1]-1] for i in range(k)]
 
 	# Get centroids before first iter
 	centroids = [getClusterCentroid(c) for c in clusters]
@@ -134,18 +138,20 @@ def kmeans1d(data, k, cutoff=False, maxIter=False):
 			if adjusted:
 				changeOccured = True
 
-		# Update centroids and compute the bigger shift
+		# Update centroids and check if they have stopped moving much
+		# (the test stops at the first shift that exceeds the cutoff value)
 		newCentroids = [getClusterCentroid(c) for c in clusters]
-		biggest_shift = max([abs(newCentroids[i] - centroids[i]) for i in range(k)])
+		converged = cutoff and all(abs(new - old) < cutoff for new, old in zip(newCentroids, centroids))
 		centroids = newCentroids
 
 		# Force stopping the main loop ...
 		# > if the centroids have stopped moving much (in the case we set a cutoff value)
 		# > or if we reach max iteration value (in the case we set a maxIter value)
-		if (cutoff and biggest_shift < cutoff) or (maxIter and loopCounter == maxIter):
+		if converged or (maxIter and loopCounter == maxIter):
 			break
 
-	#print("Converged after %s iterations" % loopCounter)
+	if verbose:
+		print("Converged after %s iterations" % loopCounter)
 	return clusters
 
 
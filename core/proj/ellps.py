@@ -11,14 +11,15 @@ class Ellps():
 
 GRS80 = Ellps(6378137, 6356752.314245)
 
+#length of one decimal degree at equator in meters
+DEG_LENGTH = GRS80.perimeter/360
+
 def dd2meters(dst):
 	"""
 	Basic function to approximaly convert a short distance in decimal degrees to meters
 	Only true at equator and along horizontal axis
 	"""
-	k = GRS80.perimeter/360
-	return dst * k
+	return dst * DEG_LENGTH
 
 def meters2dd(dst):
-	k = GRS80.perimeter/360
-	return dst / k
+	return dst / DEG_LENGTH
@@ -19,10 +19,14 @@
 
 
 import math
+import threading
+from functools import lru_cache
+
+import numpy as np
 
 from .srs import SRS
-from .utm import UTM, UTM_EPSG_CODES
-from .ellps import GRS80
+from .utm import UTM, UTM_EPSG_CODES_SET
+from .ellps import DEG_LENGTH
 from .srv import EPSGIO
 
 from ..errors import ReprojError
@@ -32,6 +36,14 @@ from .. import settings
 
 if HAS_GDAL:
 	from osgeo import osr, gdal
+	#Resampling algorithms
+	RESAMP_ALGS = {
+		'NN' : gdal.GRA_NearestNeighbour,
+		'BL' : gdal.GRA_Bilinear,
+		'CB' : gdal.GRA_Cubic,
+		'CBS' : gdal.GRA_CubicSpline,
+		'LCZ' : gdal.GRA_Lanczos
+	}
 
 if HAS_PYPROJ:
 	import pyproj
@@ -40,24 +52,47 @@ if HAS_PYPROJ:
 ######################################
 # Build in functions
 
+#constants precomputed once at import
+_DEG2RAD = math.pi / 180.0
+_RAD2DEG = 180.0 / math.pi
+_PI_OVER_360 = math.pi / 360.0
+_HALF_PI = math.pi / 2.0
+
 def webMercToLonLat(x, y):
-	k = GRS80.perimeter/360
-	lon = x / k
-	lat = y / k
-	lat = 180 / math.pi * (2 * math.atan( math.exp( lat * math.pi / 180.0)) - math.pi / 2.0)
+	lon = x / DEG_LENGTH
+	lat = y / DEG_LENGTH
+	lat = _RAD2DEG * (2 * math.atan( math.exp( lat * _DEG2RAD)) - _HALF_PI)
 	return lon, lat
 
 def lonLatToWebMerc(lon, lat):
-	k = GRS80.perimeter/360
-	x = lon * k
-	lat = math.log( math.tan((90 + lat) * math.pi / 360.0 )) / (math.pi / 180.0)
-	y = lat * k
+	x = lon * DEG_LENGTH
+	lat = math.log( math.tan((90 + lat) * _PI_OVER_360 )) * _RAD2DEG
+	y = lat * DEG_LENGTH
+	return x, y
+
+#Array versions, same formulas evaluated with numpy on whole arrays of coordinates
+
+def webMercToLonLatArray(x, y):
+	lon = np.asarray(x, dtype=np.float64) / DEG_LENGTH
+	lat = np.asarray(y, dtype=np.float64) / DEG_LENGTH
+	lat = _RAD2DEG * (2 * np.arctan( np.exp( lat * _DEG2RAD)) - _HALF_PI)
+	return lon, lat
+
+def lonLatToWebMercArray(lon, lat):
+	x = np.asarray(lon, dtype=np.float64) * DEG_LENGTH
+	lat = np.log( np.tan((90 + np.asarray(lat, dtype=np.float64)) * _PI_OVER_360 )) * _RAD2DEG
+	y = lat * DEG_LENGTH
 	return x, y
 
 
 ######################################
 # Raster reproj using GDAL
 
+@lru_cache(maxsize=64)
+def _getWkt(crs):
+	'''Return the wkt definition of a crs string, cached because osr init from epsg database is slow'''
+	return SRS(crs).getOgrSpatialRef().ExportToWkt()
+
 def reprojImg(crs1, crs2, ds1, out_ul=None, out_size=None, out_res=None, sqPx=False, resamplAlg='BL', path=None, geoTiffOptions={'TFW':'YES', 'TILED':'YES', 'BIGTIFF':'YES', 'COMPRESS':'JPEG', 'JPEG_QUALITY':80, 'PHOTOMETRIC':'YCBCR'}):
 	'''
 	Use GDAL Python binding to reproject an image
@@ -96,10 +131,15 @@ def reprojImg(crs1, crs2, ds1, out_ul=None, out_size=None, out_res=None, sqPx=Fa
 		#TODO reuse the GeoRef class to extract bbox even if there are rotation parameters
 
 	#Assign input CRS to input datasource
-	prj1 = SRS(crs1).getOgrSpatialRef()
-	wkt1 = prj1.ExportToWkt()
+	wkt1 = _getWkt(str(crs1))
 	ds1.SetProjection(wkt1)
 
+	#Nothing to do if the crs and the output geometry are unchanged
+	#(pixels must already be square if it's requested)
+	if path is None and out_ul is None and out_size is None and out_res is None and SRS(crs1) == SRS(crs2):
+		if not sqPx or abs(resx) == abs(resy):
+			return ds1
+
 	#Build destination dataset
 	# ds2 will be a template empty raster to reproject the data into
 	# we can directly set its size, res and top left coord as expected
@@ -154,23 +194,20 @@ def reprojImg(crs1, crs2, ds1, out_ul=None, out_size=None, out_res=None, sqPx=Fa
 			ds2.GetRasterBand(1).GetMaskBand().Fill(255) #WARNING, it seems gdal.ReprojectImage does not honor internal mask !
 	geoTrans = (xmin, resx, 0, ymax, 0, resy)
 	ds2.SetGeoTransform(geoTrans)
-	prj2 = SRS(crs2).getOgrSpatialRef()
-	wkt2 = prj2.ExportToWkt()
+	wkt2 = _getWkt(str(crs2))
 	ds2.SetProjection(wkt2)
 
 	#Perform the projection/resampling
 	# Resample algo
-	if resamplAlg == 'NN' : alg = gdal.GRA_NearestNeighbour
-	elif resamplAlg == 'BL' : alg = gdal.GRA_Bilinear
-	elif resamplAlg == 'CB' : alg = gdal.GRA_Cubic
-	elif resamplAlg == 'CBS' : alg = gdal.GRA_CubicSpline
-	elif resamplAlg == 'LCZ' : alg = gdal.GRA_Lanczos
-	# Memory limit (0 = no limit)
-	memLimit = 0
+	alg = RESAMP_ALGS[resamplAlg]
+	# Memory limit in bytes (0 = gdal default of 64Mb), a larger working buffer means fewer warp chunks
+	memLimit = 512 * 1024 * 1024
 	# Error in pixels (0 will use the exact transformer)
 	threshold = 0.25
 	# Warp options (http://www.gdal.org/structGDALWarpOptions.html)
-	opt = ['NUM_THREADS=ALL_CPUS, SAMPLE_GRID=YES']
+	# each option must be a distinct list item, otherwise gdal parses them as a single invalid NUM_THREADS value
+	# INIT_DEST avoid reading back the destination buffer, the template dataset is empty anyway
+	opt = ['NUM_THREADS=ALL_CPUS', 'SAMPLE_GRID=YES', 'INIT_DEST=0']
 	#option parameters available since gdal 2.1
 	a, b, c = gdal.__version__.split('.', 2)
 	if (int(a) == 2 and int(b) >=1) or int(a) > 2:
@@ -231,10 +268,19 @@ class Reproj():
 			self.crs1 = crs1.getOgrSpatialRef()
 			self.crs2 = crs2.getOgrSpatialRef()
 			self.osrTransfo = osr.CoordinateTransformation(self.crs1, self.crs2)
+			#Since PROJ 6, the order of coordinates for geographic crs is latitude first, longitude second.
+			if hasattr(osr, 'GetPROJVersionMajor'):
+				projVersion = osr.GetPROJVersionMajor()
+			else:
+				projVersion = 4
+			self.swapIn = projVersion >= 6 and self.crs1.IsGeographic()
+			self.swapOut = self.crs2.IsGeographic()
 
 		elif self.iproj == 'PYPROJ':
 			self.crs1 = crs1.getPyProj()
 			self.crs2 = crs2.getPyProj()
+			#build the transformer once, always_xy ensure lon/lat order for geographic crs
+			self.transformer = pyproj.Transformer.from_proj(self.crs1, self.crs2, always_xy=True)
 
 		elif self.iproj == 'EPSGIO':
 			if crs1.isEPSG and crs2.isEPSG:
@@ -266,75 +312,91 @@ class Reproj():
 			return pts
 
 		if self.iproj == 'GDAL':
-			#Since PROJ 6, the order of coordinates for geographic crs is latitude first, longitude second.
-			if hasattr(osr, 'GetPROJVersionMajor'):
-				projVersion = osr.GetPROJVersionMajor()
-			else:
-				projVersion = 4
-			if projVersion >= 6 and self.crs1.IsGeographic():
+			#axis order swaps are resolved once at init
+			if self.swapIn:
 				pts = [ (pt[1], pt[0]) for pt in pts]
-			if self.crs2.IsGeographic():
-				ys, xs, _zs = zip(*self.osrTransfo.TransformPoints(pts))
+			#slice the (x, y, z) output columns with numpy instead of transposing it in python
+			out = np.array(self.osrTransfo.TransformPoints(pts), dtype=np.float64)
+			if self.swapOut:
+				ys, xs = out[:,0], out[:,1]
 			else:
-				xs, ys, _zs = zip(*self.osrTransfo.TransformPoints(pts))
-			return list(zip(xs, ys))
+				xs, ys = out[:,0], out[:,1]
+			return list(zip(xs.tolist(), ys.tolist()))
 
 		elif self.iproj == 'PYPROJ':
-			if self.crs1.crs.is_geographic:
-				ys, xs = zip(*pts)
-			else:
-				xs, ys = zip(*pts)
-			transformer = pyproj.Transformer.from_proj(self.crs1, self.crs2)
-			if self.crs2.crs.is_geographic:
-				ys, xs = transformer.transform(xs, ys)
-			else:
-				xs, ys = transformer.transform(xs, ys)
-			return list(zip(xs, ys))
+			xs, ys = np.array(pts, dtype=np.float64).T
+			xs, ys = self.transformer.transform(xs, ys)
+			return list(zip(xs.tolist(), ys.tolist()))
 
 		elif self.iproj == 'EPSGIO':
 			return EPSGIO.reprojPts(self.crs1, self.crs2, pts)
 
 		elif self.iproj == 'BUILTIN':
 			#Web Mercator
+			#convert all the points at once with numpy
 			if self.crs1 == 4326 and self.crs2 == 3857:
-				return [lonLatToWebMerc(*pt) for pt in pts]
+				xs, ys = np.array(pts, dtype=np.float64).T
+				xs, ys = lonLatToWebMercArray(xs, ys)
+				return list(zip(xs.tolist(), ys.tolist()))
 			elif self.crs1 == 3857 and self.crs2 == 4326:
-				return [webMercToLonLat(*pt) for pt in pts]
+				xs, ys = np.array(pts, dtype=np.float64).T
+				xs, ys = webMercToLonLatArray(xs, ys)
+				return list(zip(xs.tolist(), ys.tolist()))
 			#UTM
-			if self.crs1 == 4326 and self.crs2 in UTM_EPSG_CODES:
-				return [self.utm.lonlat_to_utm(*pt) for pt in pts]
-			elif self.crs1 in UTM_EPSG_CODES and self.crs2 == 4326:
-				return [self.utm.utm_to_lonlat(*pt) for pt in pts]
+			if self.crs1 == 4326 and self.crs2 in UTM_EPSG_CODES_SET:
+				xs, ys = np.array(pts, dtype=np.float64).T
+				xs, ys = self.utm.lonlat_to_utm_array(xs, ys)
+				return list(zip(xs.tolist(), ys.tolist()))
+			elif self.crs1 in UTM_EPSG_CODES_SET and self.crs2 == 4326:
+				xs, ys = np.array(pts, dtype=np.float64).T
+				xs, ys = self.utm.utm_to_lonlat_array(xs, ys)
+				return list(zip(xs.tolist(), ys.tolist()))
 
 	def pt(self, x, y):
 		if x is None or y is None:
 			raise ReprojError('Cannot reproj None coordinates')
+		if self.iproj == 'NO_REPROJ':
+			return (x, y)
 		return self.pts([(x,y)])[0]
 
 
 	def bbox(self, bbox):
 		'''io type = BBOX() class'''
+		if self.iproj == 'NO_REPROJ':
+			#return a copy, as the caller always expect a new bbox
+			return BBOX(*bbox) #list must be ordered from bottom left upper right
 		if not isinstance(bbox, BBOX):
 			bbox = BBOX(*bbox) #list must be ordered from bottom left upper right
-		corners = self.pts(bbox.corners)
-		_xmin = min( pt[0] for pt in corners )
-		_xmax = max( pt[0] for pt in corners )
-		_ymin = min( pt[1] for pt in corners )
-		_ymax = max( pt[1] for pt in corners )
+		xs, ys = zip(*self.pts(bbox.corners))
+		_xmin, _xmax = min(xs), max(xs)
+		_ymin, _ymax = min(ys), max(ys)
 		if bbox.hasZ:
 			return BBOX(_xmin, _ymin, bbox.zmin, _xmax, _ymax, bbox.zmax)
 		else:
 			return BBOX(_xmin, _ymin, _xmax, _ymax)
 
 
+@lru_cache(maxsize=64)
+def _getReproj(crs1, crs2, engine, thread):
+	'''
+	Return a cached Reproj instance, the returned object is shared and must not be modified
+	The proj engine setting is part of the key so that a change in the addon prefs is honored
+	The thread id is also part of the key because gdal and pyproj transformers are not thread safe
+	'''
+	return Reproj(crs1, crs2)
+
+def getReproj(crs1, crs2):
+	'''Get a shared Reproj instance for this couple of crs, suitable for repeated calls'''
+	return _getReproj(str(crs1), str(crs2), settings.proj_engine, threading.get_ident())
+
 
 def reprojPt(crs1, crs2, x, y):
 	"""
 	Reproject x1,y1 coords from crs1 to crs2
 	crs can be an EPSG code (interger or string) or a proj4 string
-	WARN : do not use this function in a loop because Reproj() init is slow
+	the Reproj() instance is cached so repeated calls with the same crs are cheap
 	"""
-	rprj = Reproj(crs1, crs2)
+	rprj = getReproj(crs1, crs2)
 	return rprj.pt(x, y)
 
 
@@ -343,11 +405,11 @@ def reprojPts(crs1, crs2, pts):
 	Reproject [pts] from crs1 to crs2
 	crs can be an EPSG code (integer or srid string) or a proj4 string
 	pts must be [(x,y)]
-	WARN : do not use this function in a loop because Reproj() init is slow
+	the Reproj() instance is cached so repeated calls with the same crs are cheap
 	"""
-	rprj = Reproj(crs1, crs2)
+	rprj = getReproj(crs1, crs2)
 	return rprj.pts(pts)
 
 def reprojBbox(crs1, crs2, bbox):
-	rprj = Reproj(crs1, crs2)
+	rprj = getReproj(crs1, crs2)
 	return rprj.bbox(bbox)
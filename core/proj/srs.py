@@ -19,7 +19,7 @@
 import logging
 log = logging.getLogger(__name__)
 
-from .utm import UTM, UTM_EPSG_CODES
+from .utm import UTM, UTM_EPSG_CODES_SET
 from .srv import EPSGIO
 
 from ..checkdeps import HAS_GDAL, HAS_PYPROJ
@@ -84,6 +84,25 @@ class SRS():
 		else:
 			raise ValueError('Invalid CRS : '+crs)
 
+		#these flags only depend on auth and code, compute them once as plain attributes
+		self.hasCode = self.code is not None
+		self.hasAuth = self.auth is not None
+		self.isSRID = self.hasAuth and self.hasCode
+		self.isEPSG = self.auth == 'EPSG' and self.hasCode
+		self.isWM = self.isEPSG and self.code == 3857
+		self.isWGS84 = self.isEPSG and self.code == 4326
+		self.isUTM = self.isEPSG and self.code in UTM_EPSG_CODES_SET
+		if self.isSRID:
+			self.SRID = self.auth + ':' + str(self.code)
+		else:
+			self.SRID = None
+
+		#the string representation is used for each comparison, build it only once
+		if self.isSRID:
+			self._str = self.SRID
+		else:
+			self._str = self.proj4
+
 	@classmethod
 	def fromGDAL(cls, ds):
 		if not HAS_GDAL:
@@ -95,50 +114,12 @@ class SRS():
 		crs.ImportFromWkt(wkt)
 		return cls(crs.ExportToProj4())
 
-	@property
-	def SRID(self):
-		if self.isSRID:
-			return self.auth + ':' + str(self.code)
-		else:
-			return None
-
-	@property
-	def hasCode(self):
-		return self.code is not None
-
-	@property
-	def hasAuth(self):
-		return self.auth is not None
-
-	@property
-	def isSRID(self):
-		return self.hasAuth and self.hasCode
-
-	@property
-	def isEPSG(self):
-		return self.auth == 'EPSG' and self.code is not None
-
-	@property
-	def isWM(self):
-		return self.auth == 'EPSG' and self.code == 3857
-
-	@property
-	def isWGS84(self):
-		return self.auth == 'EPSG' and self.code == 4326
-
-	@property
-	def isUTM(self):
-		return self.auth == 'EPSG' and self.code in UTM_EPSG_CODES
-
 	def __str__(self):
 		'''Return the best string representation for this crs'''
-		if self.isSRID:
-			return self.SRID
-		else:
-			return self.proj4
+		return self._str
 
 	def __eq__(self, srs2):
-		return self.__str__() == srs2.__str__()
+		return self._str == str(srs2)
 
 	def getOgrSpatialRef(self):
 		'''Build gdal osr spatial ref object'''
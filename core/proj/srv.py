@@ -20,16 +20,87 @@ import logging
 log = logging.getLogger(__name__)
 
 
-from urllib.request import Request, urlopen
+from urllib.request import Request, urlopen, getproxies, proxy_bypass
 from urllib.error import URLError, HTTPError
+from urllib.parse import urlencode, urlparse
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 import json
 
 from .. import settings
+from ..checkdeps import HAS_URLLIB3
 
 USER_AGENT = settings.user_agent
 
 DEFAULT_TIMEOUT = 2
 REPROJ_TIMEOUT = 60
+#max number of concurrent requests when the points are split into several chunks
+REPROJ_THREADS = 8
+
+if HAS_URLLIB3:
+	import urllib3
+
+#shared pools of keep-alive connections, one per proxy (None for direct connections)
+_POOLS = {}
+_POOLS_LOCK = threading.Lock()
+
+@lru_cache(maxsize=32)
+def _getProxy(scheme, host):
+	'''
+	Return the system proxy url to use for this scheme and host, or None for a direct connection
+	Resolved the same way as urlopen does, cached because it can query the system settings
+	'''
+	if proxy_bypass(host):
+		return None
+	return getproxies().get(scheme)
+
+def _getPool(url):
+	'''
+	Return a shared urllib3 pool manager for this url, thread safe and sized for the concurrent reproj requests
+	System proxy settings are honored the same way as urlopen does
+	'''
+	u = urlparse(url)
+	proxy = _getProxy(u.scheme, u.hostname)
+	with _POOLS_LOCK:
+		pool = _POOLS.get(proxy)
+		if pool is None:
+			#no retry on connection or read errors (same behavior as urlopen) but follow redirections
+			retries = urllib3.Retry(connect=0, read=0, redirect=5)
+			if proxy:
+				pool = urllib3.ProxyManager(proxy, maxsize=REPROJ_THREADS, retries=retries)
+			else:
+				pool = urllib3.PoolManager(maxsize=REPROJ_THREADS, retries=retries)
+			_POOLS[proxy] = pool
+	return pool
+
+def _httpGet(url, timeout, read=True):
+	'''
+	Send a GET request and return the decoded response body (or None if read is False)
+	Reuse pooled connections if urllib3 is available, errors are raised as urllib URLError or HTTPError
+	'''
+	if HAS_URLLIB3:
+		try:
+			r = _getPool(url).request('GET', url, headers={'User-Agent': USER_AGENT}, timeout=timeout, preload_content=read)
+		except urllib3.exceptions.HTTPError as e:
+			raise URLError(e)
+		if not read:
+			#discard the unread body before giving the connection back to the pool,
+			#otherwise the next request could reuse a connection with a pending response
+			if hasattr(r, 'drain_conn'):
+				r.drain_conn()
+			else: #older urllib3
+				r.read()
+			r.release_conn()
+		if r.status >= 400:
+			raise HTTPError(url, r.status, r.reason, r.headers, None)
+		if read:
+			return r.data.decode('utf8')
+	else:
+		rq = Request(url, headers={'User-Agent': USER_AGENT})
+		with urlopen(rq, timeout=timeout) as r:
+			if read:
+				return r.read().decode('utf8')
 
 ######################################
 # EPSG.io
@@ -42,8 +113,8 @@ class EPSGIO():
 	def ping():
 		url = "http://epsg.io"
 		try:
-			rq = Request(url, headers={'User-Agent': USER_AGENT})
-			urlopen(rq, timeout=DEFAULT_TIMEOUT)
+			#just check the connection, the page content is not needed
+			_httpGet(url, DEFAULT_TIMEOUT, read=False)
 			return True
 		except URLError as e:
 			log.error('Cannot ping {} web service, {}'.format(url, e.reason))
@@ -55,22 +126,18 @@ class EPSGIO():
 			raise
 
 
+	#results are cached by request parameters, so an already reprojected location costs no network call
 	@staticmethod
+	@lru_cache(maxsize=1024)
 	def reprojPt(epsg1, epsg2, x1, y1):
 
-		url = "http://epsg.io/trans?x={X}&y={Y}&z={Z}&s_srs={CRS1}&t_srs={CRS2}"
-
-		url = url.replace("{X}", str(x1))
-		url = url.replace("{Y}", str(y1))
-		url = url.replace("{Z}", '0')
-		url = url.replace("{CRS1}", str(epsg1))
-		url = url.replace("{CRS2}", str(epsg2))
+		params = urlencode({'x': x1, 'y': y1, 'z': 0, 's_srs': epsg1, 't_srs': epsg2})
+		url = "http://epsg.io/trans?" + params
 
 		log.debug(url)
 
 		try:
-			rq = Request(url, headers={'User-Agent': USER_AGENT})
-			response = urlopen(rq, timeout=REPROJ_TIMEOUT).read().decode('utf8')
+			response = _httpGet(url, REPROJ_TIMEOUT)
 		except (URLError, HTTPError) as err:
 			log.error('Http request fails url:{}, code:{}, error:{}'.format(url, err.code, err.reason))
 			raise
@@ -82,67 +149,80 @@ class EPSGIO():
 	@staticmethod
 	def reprojPts(epsg1, epsg2, points):
 
+		if len(points) == 0:
+			return []
+
 		if len(points) == 1:
 			x, y = points[0]
 			return [EPSGIO.reprojPt(epsg1, epsg2, x, y)]
 
-		urlTemplate = "http://epsg.io/trans?data={POINTS}&s_srs={CRS1}&t_srs={CRS2}"
-
-		urlTemplate = urlTemplate.replace("{CRS1}", str(epsg1))
-		urlTemplate = urlTemplate.replace("{CRS2}", str(epsg2))
+		#crs params are encoded once and shared by all the chunks
+		crsParams = urlencode({'s_srs': epsg1, 't_srs': epsg2})
 
 		#data = ';'.join([','.join(map(str, p)) for p in points])
 
 		precision = 4
-		data = [','.join( [str(round(v, precision)) for v in p] ) for p in points ]
-		part, parts = [], []
-		for i,p in enumerate(data):
-			l = sum([len(p) for p in part]) + len(';'*len(part))
+		data = [','.join( str(round(v, precision)) for v in p ) for p in points ]
+		#l is the running length of the current part including its separators
+		part, parts, l = [], [], 0
+		for p in data:
 			if l + len(p) < 4000: #limit is 4094
 				part.append(p)
+				l += len(p) + 1
 			else:
 				parts.append(part)
 				part = [p]
-			if i == len(data)-1:
-				parts.append(part)
+				l = len(p) + 1
+		if part:
+			parts.append(part)
 		parts = [';'.join(part) for part in parts]
 
-		result = []
-		for part in parts:
-			url = urlTemplate.replace("{POINTS}", part)
-			log.debug(url)
+		#keep coords separators unescaped so the data length match the url length limit
+		urls = ["http://epsg.io/trans?{}&{}".format(urlencode({'data': part}, safe=',;'), crsParams) for part in parts]
 
-			try:
-				rq = Request(url, headers={'User-Agent': USER_AGENT})
-				response = urlopen(rq, timeout=REPROJ_TIMEOUT).read().decode('utf8')
-			except (URLError, HTTPError) as err:
-				log.error('Http request fails url:{}, code:{}, error:{}'.format(url, err.code, err.reason))
-				raise
+		#chunks are independent, send them concurrently to overlap network latencies
+		#map() returns the responses in the same order as the submitted chunks
+		if len(urls) == 1:
+			responses = [EPSGIO._reprojChunk(urls[0])]
+		else:
+			with ThreadPoolExecutor(max_workers=min(REPROJ_THREADS, len(urls))) as executor:
+				responses = list(executor.map(EPSGIO._reprojChunk, urls))
 
-			obj = json.loads(response)
-			result.extend( [(float(p['x']), float(p['y'])) for p in obj] )
+		result = []
+		for pts in responses:
+			result.extend(pts)
 
 		return result
 
+	#coords are rounded before building the chunks, so identical chunks give identical urls
+	@staticmethod
+	@lru_cache(maxsize=256)
+	def _reprojChunk(url):
+		'''Request a chunk of points, return a tuple of reprojected (x, y)'''
+		log.debug(url)
+		try:
+			response = _httpGet(url, REPROJ_TIMEOUT)
+		except (URLError, HTTPError) as err:
+			log.error('Http request fails url:{}, code:{}, error:{}'.format(url, err.code, err.reason))
+			raise
+		obj = json.loads(response)
+		return tuple( (float(p['x']), float(p['y'])) for p in obj )
+
 	@staticmethod
 	def search(query):
-		query = str(query).replace(' ', '+')
-		url = "http://epsg.io/?q={QUERY}&format=json"
-		url = url.replace("{QUERY}", query)
+		url = "http://epsg.io/?" + urlencode({'q': query, 'format': 'json'})
 		log.debug('Search crs : {}'.format(url))
-		rq = Request(url, headers={'User-Agent': USER_AGENT})
-		response = urlopen(rq, timeout=DEFAULT_TIMEOUT).read().decode('utf8')
+		response = _httpGet(url, DEFAULT_TIMEOUT)
 		obj = json.loads(response)
 		log.debug('Search results : {}'.format([ (r['code'], r['name']) for r in obj['results'] ]))
 		return obj['results']
 
 	@staticmethod
+	@lru_cache(maxsize=256)
 	def getEsriWkt(epsg):
-		url = "http://epsg.io/{CODE}.esriwkt"
-		url = url.replace("{CODE}", str(epsg))
+		url = "http://epsg.io/{}.esriwkt".format(epsg)
 		log.debug(url)
-		rq = Request(url, headers={'User-Agent': USER_AGENT})
-		wkt = urlopen(rq, timeout=DEFAULT_TIMEOUT).read().decode('utf8')
+		wkt = _httpGet(url, DEFAULT_TIMEOUT)
 		return wkt
 
 
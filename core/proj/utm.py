@@ -9,6 +9,7 @@
 # formulas : https://en.wikipedia.org/wiki/Universal_Transverse_Mercator_coordinate_system
 
 import math
+import numpy as np
 
 
 K0 = 0.9996
@@ -62,6 +63,9 @@ def zone_number_to_central_longitude(zone_number):
 
 #UTM_EPSG_CODES = ['326' + str(i).zfill(2) for i in range(1,61)] + ['327' + str(i).zfill(2) for i in range(1,61)]
 UTM_EPSG_CODES = [32600 + i for i in range(1,61)] + [32700 + i for i in range(1,61)]
+#hashed versions for fast membership tests
+UTM_EPSG_CODES_SET = frozenset(UTM_EPSG_CODES)
+_UTM_EPSG_CODES_STR = frozenset(map(str, UTM_EPSG_CODES))
 
 def _code_from_epsg(epsg):
 	'''Return & validate EPSG code str from user input'''
@@ -72,7 +76,7 @@ def _code_from_epsg(epsg):
 		auth, code = epsg.split(':')
 	else:
 		raise ValueError('Invalid UTM EPSG code')
-	if code in map(str, UTM_EPSG_CODES):
+	if code in _UTM_EPSG_CODES_STR:
 		return code
 	else:
 		raise ValueError('Invalid UTM EPSG code')
@@ -113,6 +117,9 @@ class UTM():
 			raise OutOfRangeError('zone number out of range (must be between 1 and 60)')
 		self.zone_number = zone
 		self.northern = north
+		#central meridian only depends on the zone, compute it once
+		self._central_lon = zone_number_to_central_longitude(zone)
+		self._central_lon_rad = math.radians(self._central_lon)
 
 	@classmethod
 	def init_from_epsg(cls, epsg):
@@ -126,38 +133,56 @@ class UTM():
 
 
 	def utm_to_lonlat(self, easting, northing):
+		'''Convert a single utm coordinate, see utm_to_lonlat_array'''
+		lon, lat = self.utm_to_lonlat_array([easting], [northing])
+		return lon[0].item(), lat[0].item()
 
-		if not 100000 <= easting < 1000000:
+	def lonlat_to_utm(self, longitude, latitude):
+		'''Convert a single lonlat coordinate, see lonlat_to_utm_array'''
+		easting, northing = self.lonlat_to_utm_array([longitude], [latitude])
+		return easting[0].item(), northing[0].item()
+
+
+	######
+	# Conversions evaluated with numpy ufuncs on whole arrays of coordinates
+	# range checks are written so that nan values are rejected
+
+	def utm_to_lonlat_array(self, easting, northing):
+		'''Convert arrays of easting and northing values, return a tuple of 2 arrays (lons, lats)'''
+		easting = np.asarray(easting, dtype=np.float64)
+		northing = np.asarray(northing, dtype=np.float64)
+
+		if not np.all((easting >= 100000) & (easting < 1000000)):
 			raise OutOfRangeError('easting out of range (must be between 100.000 m and 999.999 m)')
-		if not 0 <= northing <= 10000000:
+		if not np.all((northing >= 0) & (northing <= 10000000)):
 			raise OutOfRangeError('northing out of range (must be between 0 m and 10.000.000 m)')
 
 		x = easting - 500000
 		y = northing
 
 		if not self.northern:
-			y -= 10000000
+			y = y - 10000000
 
 		m = y / K0
 		mu = m / (R * M1)
 
 		p_rad = (mu +
-				 P2 * math.sin(2 * mu) +
-				 P3 * math.sin(4 * mu) +
-				 P4 * math.sin(6 * mu) +
-				 P5 * math.sin(8 * mu))
+				 P2 * np.sin(2 * mu) +
+				 P3 * np.sin(4 * mu) +
+				 P4 * np.sin(6 * mu) +
+				 P5 * np.sin(8 * mu))
 
-		p_sin = math.sin(p_rad)
+		p_sin = np.sin(p_rad)
 		p_sin2 = p_sin * p_sin
 
-		p_cos = math.cos(p_rad)
+		p_cos = np.cos(p_rad)
 
 		p_tan = p_sin / p_cos
 		p_tan2 = p_tan * p_tan
 		p_tan4 = p_tan2 * p_tan2
 
 		ep_sin = 1 - E * p_sin2
-		ep_sin_sqrt = math.sqrt(1 - E * p_sin2)
+		ep_sin_sqrt = np.sqrt(ep_sin)
 
 		n = R / ep_sin_sqrt
 		r = (1 - E) / ep_sin
@@ -181,32 +206,33 @@ class UTM():
 					 d3 / 6 * (1 + 2 * p_tan2 + c) +
 					 d5 / 120 * (5 - 2 * c + 28 * p_tan2 - 3 * c2 + 8 * E_P2 + 24 * p_tan4)) / p_cos
 
-		return (math.degrees(longitude) + zone_number_to_central_longitude(self.zone_number),
-				math.degrees(latitude))
+		return (np.degrees(longitude) + self._central_lon,
+				np.degrees(latitude))
 
 
-	def lonlat_to_utm(self, longitude, latitude):
-		if not -80.0 <= latitude <= 84.0:
+	def lonlat_to_utm_array(self, longitude, latitude):
+		'''Convert arrays of longitude and latitude values, return a tuple of 2 arrays (eastings, northings)'''
+		longitude = np.asarray(longitude, dtype=np.float64)
+		latitude = np.asarray(latitude, dtype=np.float64)
+
+		if not np.all((latitude >= -80.0) & (latitude <= 84.0)):
 			raise OutOfRangeError('latitude out of range (must be between 80 deg S and 84 deg N)')
-		if not -180.0 <= longitude <= 180.0:
+		if not np.all((longitude >= -180.0) & (longitude <= 180.0)):
 			raise OutOfRangeError('longitude out of range (must be between 180 deg W and 180 deg E)')
 
-		lat_rad = math.radians(latitude)
-		lat_sin = math.sin(lat_rad)
-		lat_cos = math.cos(lat_rad)
+		lat_rad = np.radians(latitude)
+		lat_sin = np.sin(lat_rad)
+		lat_cos = np.cos(lat_rad)
 
 		lat_tan = lat_sin / lat_cos
 		lat_tan2 = lat_tan * lat_tan
 		lat_tan4 = lat_tan2 * lat_tan2
 
-		lon_rad = math.radians(longitude)
-		central_lon = zone_number_to_central_longitude(self.zone_number)
-		central_lon_rad = math.radians(central_lon)
-
-		n = R / math.sqrt(1 - E * lat_sin**2)
+		lon_rad = np.radians(longitude)
+		n = R / np.sqrt(1 - E * lat_sin**2)
 		c = E_P2 * lat_cos**2
 
-		a = lat_cos * (lon_rad - central_lon_rad)
+		a = lat_cos * (lon_rad - self._central_lon_rad)
 		a2 = a * a
 		a3 = a2 * a
 		a4 = a3 * a
@@ -214,9 +240,9 @@ class UTM():
 		a6 = a5 * a
 
 		m = R * (M1 * lat_rad -
-				 M2 * math.sin(2 * lat_rad) +
-				 M3 * math.sin(4 * lat_rad) -
-				 M4 * math.sin(6 * lat_rad))
+				 M2 * np.sin(2 * lat_rad) +
+				 M3 * np.sin(4 * lat_rad) -
+				 M4 * np.sin(6 * lat_rad))
 
 		easting = K0 * n * (a +
 							a3 / 6 * (1 - lat_tan2 + c) +
@@ -23,9 +23,12 @@ from . import XY
 import logging
 log = logging.getLogger(__name__)
 
-class BBOX(dict):
+class BBOX():
 	'''A class to represent a bounding box'''
 
+	#fixed attributes layout, faster to access and lighter than an instance dict
+	__slots__ = ('xmin', 'ymin', 'zmin', 'xmax', 'ymax', 'zmax', 'hasZ')
+
 	def __init__(self, *args, **kwargs):
 		'''
 		Three ways for init a BBOX class:
@@ -41,8 +44,10 @@ class BBOX(dict):
 				args = args[0]
 			if len(args) == 4:
 				self.xmin, self.ymin, self.xmax, self.ymax = args
+				self.hasZ = False
 			elif len(args) == 6:
 				self.xmin, self.ymin, self.zmin, self.xmax, self.ymax, self.zmax = args
+				self.hasZ = True
 			else:
 				raise ValueError('BBOX() initialization expects 4 or 6 arguments, got %g' % len(args))
 		elif kwargs:
@@ -50,14 +55,17 @@ class BBOX(dict):
 				raise ValueError('invalid keyword arguments')
 			self.xmin, self.xmax = kwargs['xmin'], kwargs['xmax']
 			self.ymin, self.ymax = kwargs['ymin'], kwargs['ymax']
-			if 'zmin' in kwargs and 'zmax' in kwargs:
+			self.hasZ = 'zmin' in kwargs and 'zmax' in kwargs
+			if self.hasZ:
 				self.zmin, self.zmax = kwargs['zmin'], kwargs['zmax']
+		else:
+			self.hasZ = False
 
 	def __str__(self):
 		if self.hasZ:
-			return 'xmin:%g, ymin:%g, zmin:%g, xmax:%g, ymax:%g, zmax:%g' % tuple(self)
+			return 'xmin:%g, ymin:%g, zmin:%g, xmax:%g, ymax:%g, zmax:%g' % self.values()
 		else:
-			return 'xmin:%g, ymin:%g, xmax:%g, ymax:%g' % tuple(self)
+			return 'xmin:%g, ymin:%g, xmax:%g, ymax:%g' % self.values()
 
 	def __getitem__(self, attr):
 		'''access attributes like a dictionnary'''
@@ -70,22 +78,25 @@ class BBOX(dict):
 	def __iter__(self):
 		'''iterate overs values in bottom left to upper right order
 		allows support of unpacking and conversion to tuple or list'''
-		if self.hasZ:
-			return iter([self.xmin, self.ymin, self.zmin, self.xmax, self.ymax, self.ymax])
-		else:
-			return iter([self.xmin, self.ymin, self.xmax, self.ymax])
+		return iter(self.values())
 
 	def keys(self):
-		'''override dict keys() method'''
-		return self.__dict__.keys()
+		'''dict like keys() method'''
+		if self.hasZ:
+			return ['xmin', 'ymin', 'zmin', 'xmax', 'ymax', 'zmax']
+		else:
+			return ['xmin', 'ymin', 'xmax', 'ymax']
 
 	def items(self):
-		'''override dict keys() method'''
-		return self.__dict__.items()
+		'''dict like items() method'''
+		return [(k, getattr(self, k)) for k in self.keys()]
 
 	def values(self):
-		'''override dict keys() method'''
-		return self.__dict__.values()
+		'''dict like values() method, return a tuple of values ordered from bottom left to upper right'''
+		if self.hasZ:
+			return (self.xmin, self.ymin, self.zmin, self.xmax, self.ymax, self.zmax)
+		else:
+			return (self.xmin, self.ymin, self.xmax, self.ymax)
 
 	@classmethod
 	def fromXYZ(cls, lst):
@@ -115,14 +126,6 @@ class BBOX(dict):
 		'''Export to simple tuple of values ordered as latlon format in 2D'''
 		return (self.ymin, self.xmin, self.ymax, self.xmax)
 
-	@property
-	def hasZ(self):
-		'''Check if this bbox is in 3D'''
-		if hasattr(self, 'zmin') and hasattr(self, 'zmax'):
-			return True
-		else:
-			return False
-
 	def to2D(self):
 		'''Cast 3d bbox to 2d >> discard zmin and zmax values'''
 		return BBOX(self.xmin, self.ymin, self.xmax, self.ymax)
@@ -132,10 +135,10 @@ class BBOX(dict):
 		if geoscn.isBroken or not geoscn.isGeoref:
 			log.warning('Cannot convert bbox, invalid georef')
 			return None
-		xmax = geoscn.crsx + (self.xmax * geoscn.scale)
-		ymax = geoscn.crsy + (self.ymax * geoscn.scale)
-		xmin = geoscn.crsx + (self.xmin * geoscn.scale)
-		ymin = geoscn.crsy + (self.ymin * geoscn.scale)
+		#each geoscn property is a scene custom property lookup, read them only once
+		crsx, crsy, scale = geoscn.crsx, geoscn.crsy, geoscn.scale
+		xmin, xmax = crsx + self.xmin * scale, crsx + self.xmax * scale
+		ymin, ymax = crsy + self.ymin * scale, crsy + self.ymax * scale
 		if self.hasZ:
 			return BBOX(xmin, ymin, self.zmin, xmax, ymax, self.zmax)
 		else:
@@ -152,23 +155,23 @@ class BBOX(dict):
 
 	def overlap(self, bb):
 		'''Test if 2 bbox objects have intersection areas (in 2D only)'''
-		def test_overlap(a_min, a_max, b_min, b_max):
-			return not ((a_min > b_max) or (b_min > a_max))
-		return test_overlap(self.xmin, self.xmax, bb.xmin, bb.xmax) and test_overlap(self.ymin, self.ymax, bb.ymin, bb.ymax)
+		return (self.xmin <= bb.xmax) & (bb.xmin <= self.xmax) & (self.ymin <= bb.ymax) & (bb.ymin <= self.ymax)
+
+	@staticmethod
+	def overlapBatch(a, b):
+		'''
+		Vectorized version of overlap() for numpy arrays of shape (n, 4)
+		where each row is (xmin, ymin, xmax, ymax), return a boolean mask
+		'''
+		return (a[:,0] <= b[:,2]) & (b[:,0] <= a[:,2]) & (a[:,1] <= b[:,3]) & (b[:,1] <= a[:,3])
 
 	def isWithin(self, bb):
 		'''Test if this bbox is within another bbox'''
-		if bb.xmin <= self.xmin and bb.xmax >= self.xmax and bb.ymin <= self.ymin and bb.ymax >= self.ymax:
-			return True
-		else:
-			return False
+		return (bb.xmin <= self.xmin) & (bb.xmax >= self.xmax) & (bb.ymin <= self.ymin) & (bb.ymax >= self.ymax)
 
 	def contains(self, bb):
 		'''Test if this bbox contains another bbox'''
-		if bb.xmin > self.xmin and bb.xmax < self.xmax and bb.ymin > self.ymin and bb.ymax < self.ymax:
-			return True
-		else:
-			return False
+		return (bb.xmin > self.xmin) & (bb.xmax < self.xmax) & (bb.ymin > self.ymin) & (bb.ymax < self.ymax)
 
 	def __add__(self, bb):
 		'''Use '+' operator to perform the union of 2 bbox'''
@@ -183,6 +186,31 @@ class BBOX(dict):
 		else:
 			return BBOX(xmin, ymin, xmax, ymax)
 
+	def __iadd__(self, bb):
+		'''Use '+=' operator to perform the union of 2 bbox in place, without building a new BBOX'''
+		self.xmin = min(self.xmin, bb.xmin)
+		self.ymin = min(self.ymin, bb.ymin)
+		self.xmax = max(self.xmax, bb.xmax)
+		self.ymax = max(self.ymax, bb.ymax)
+		if self.hasZ and bb.hasZ:
+			self.zmin = min(self.zmin, bb.zmin)
+			self.zmax = max(self.zmax, bb.zmax)
+		else:
+			self.hasZ = False
+		return self
+
+	@classmethod
+	def unionAll(cls, bboxes):
+		'''Compute the union of an iterable of bbox in a single pass'''
+		bboxes = iter(bboxes)
+		try:
+			bbox = cls(*next(bboxes)) #copy the first one, the inputs must not be altered
+		except StopIteration:
+			raise ValueError('unionAll() expects at least one bbox')
+		for bb in bboxes:
+			bbox += bb
+		return bbox
+
 	def shift(self, dx, dy):
 		'''translate the bbox in 2D'''
 		self.xmin += dx
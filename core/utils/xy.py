@@ -22,6 +22,7 @@
 
 class XY(object):
 	'''A class to represent 2-tuple value'''
+	__slots__ = ('data',) #no instance dict, values are stored in a mutable list
 	def __init__(self, x, y, z=None):
 		'''
 		You can use the constructor in many ways:
@@ -57,10 +58,9 @@ class XY(object):
 		return self.data[1]
 	@property
 	def z(self):
-		try:
+		if len(self.data) == 3:
 			return self.data[2]
-		except IndexError:
-			return None
+		return None
 	@property
 	def xy(self):
 		return self.data[:2]
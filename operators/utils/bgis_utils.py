@@ -1,4 +1,6 @@
 
+import numpy as np
+
 import bpy
 from mathutils import Vector, Matrix
 from mathutils.bvhtree import BVHTree
@@ -81,25 +83,28 @@ def placeObj(mesh, objName):
 
 def adjust3Dview(context, bbox, zoomToSelect=True):
 	'''adjust all 3d views clip distance to match the submited bbox'''
+	#clip distances only depend on the bbox so they are computed once for all areas
 	dst = round(max(bbox.dimensions))
 	k = 5 #increase factor
 	dst = dst * k
+	if dst < 100:
+		clipStart = 1
+	elif dst < 1000:
+		clipStart = 10
+	else:
+		clipStart = 100
+	clipEnd = min(dst, 10000000) #too large clip distance broke the 3d view
 	# set each 3d view
 	areas = context.screen.areas
 	for area in areas:
 		if area.type == 'VIEW_3D':
 			space = area.spaces.active
-			if dst < 100:
-				space.clip_start = 1
-			elif dst < 1000:
-				space.clip_start = 10
-			else:
-				space.clip_start = 100
+			#skip rna writes when the value is already set
+			if space.clip_start != clipStart:
+				space.clip_start = clipStart
 			#Adjust clip end distance if the new obj is largest than actual setting
-			if space.clip_end < dst:
-				if dst > 10000000:
-					dst = 10000000 #too large clip distance broke the 3d view
-				space.clip_end = dst
+			if space.clip_end < dst and space.clip_end != clipEnd:
+				space.clip_end = clipEnd
 			if zoomToSelect:
 				overrideContext = context.copy()
 				overrideContext['area'] = area
@@ -154,18 +159,25 @@ class getBBOX():
 	'''Utilities to build BBOX object from various Blender context'''
 
 	@staticmethod
-	def fromObj(obj, applyTransform = True):
-		'''Create a 3D BBOX from Blender object'''
+	def _boundPts(obj, applyTransform = True):
+		'''Return the 8 corners of object bound box as a (8,3) numpy array'''
+		try:
+			boundPts = np.empty(24, dtype=np.float32)
+			obj.bound_box.foreach_get(boundPts)
+		except AttributeError: #foreach_get not available on bound_box with older Blender
+			boundPts = np.asarray(obj.bound_box, dtype=np.float32)
+		boundPts = boundPts.reshape(8, 3).astype(np.float64)
 		if applyTransform:
-			boundPts = [obj.matrix_world @ Vector(corner) for corner in obj.bound_box]
-		else:
-			boundPts = obj.bound_box
-		xmin = min([pt[0] for pt in boundPts])
-		xmax = max([pt[0] for pt in boundPts])
-		ymin = min([pt[1] for pt in boundPts])
-		ymax = max([pt[1] for pt in boundPts])
-		zmin = min([pt[2] for pt in boundPts])
-		zmax = max([pt[2] for pt in boundPts])
+			m = np.array(obj.matrix_world)
+			boundPts = boundPts @ m[:3,:3].T + m[:3,3]
+		return boundPts
+
+	@classmethod
+	def fromObj(cls, obj, applyTransform = True):
+		'''Create a 3D BBOX from Blender object'''
+		boundPts = cls._boundPts(obj, applyTransform)
+		xmin, ymin, zmin = boundPts.min(axis=0).tolist()
+		xmax, ymax, zmax = boundPts.max(axis=0).tolist()
 		return BBOX(xmin=xmin, ymin=ymin, zmin=zmin, xmax=xmax, ymax=ymax, zmax=zmax)
 
 	@classmethod
@@ -175,24 +187,23 @@ class getBBOX():
 		#objs = scn.collection.objects
 		objs = [obj for obj in scn.collection.all_objects if obj.empty_display_type != 'IMAGE']
 		if len(objs) == 0:
-			scnBbox = BBOX(0,0,0,0,0,0)
-		else:
-			scnBbox = cls.fromObj(objs[0])
-		for obj in objs:
-			bbox = cls.fromObj(obj)
-			scnBbox += bbox
-		return scnBbox
+			return BBOX(0,0,0,0,0,0)
+		#stack the bound box corners of all objects and reduce them at once
+		boundPts = np.empty((len(objs)*8, 3))
+		for i, obj in enumerate(objs):
+			boundPts[i*8:(i+1)*8] = cls._boundPts(obj)
+		xmin, ymin, zmin = boundPts.min(axis=0).tolist()
+		xmax, ymax, zmax = boundPts.max(axis=0).tolist()
+		return BBOX(xmin=xmin, ymin=ymin, zmin=zmin, xmax=xmax, ymax=ymax, zmax=zmax)
 
 	@staticmethod
 	def fromBmesh(bm):
 		'''Create a 3D bounding box from a bmesh object'''
-		xmin = min([pt.co.x for pt in bm.verts])
-		xmax = max([pt.co.x for pt in bm.verts])
-		ymin = min([pt.co.y for pt in bm.verts])
-		ymax = max([pt.co.y for pt in bm.verts])
-		zmin = min([pt.co.z for pt in bm.verts])
-		zmax = max([pt.co.z for pt in bm.verts])
-		#
+		#bmesh has no foreach_get, so gather all coords in a single pass
+		n = len(bm.verts)
+		pts = np.fromiter((c for v in bm.verts for c in v.co), dtype=np.float64, count=n*3).reshape(n, 3)
+		xmin, ymin, zmin = pts.min(axis=0).tolist()
+		xmax, ymax, zmax = pts.max(axis=0).tolist()
 		return BBOX(xmin=xmin, ymin=ymin, zmin=zmin, xmax=xmax, ymax=ymax, zmax=zmax)
 
 	@staticmethod
@@ -0,0 +1,20 @@
+# -*- coding:utf-8 -*-
+import os
+import sys
+import unittest
+
+#make the core package importable without Blender
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.proj.srv import EPSGIO
+
+
+class TestEPSGIO(unittest.TestCase):
+
+	def test_reprojPts_empty(self):
+		#no points means no request at all
+		self.assertEqual(EPSGIO.reprojPts(4326, 3857, []), [])
+
+
+if __name__ == '__main__':
+	unittest.main()